@@ -43,6 +43,7 @@ CONTROL_QUEUE = 'ipc:///tmp/piw-control'
 BUILDS_QUEUE = 'inproc://builds'
 STATS_QUEUE = 'inproc://stats'
 DB_QUEUE = 'inproc://db'
+DB_WORKERS = 3
 FS_QUEUE = 'inproc://fs'
 WEB_QUEUE = 'inproc://web'
 SLAVE_QUEUE = 'tcp://*:5555'
@@ -54,4 +55,6 @@ LOG_QUEUE = 'ipc:///tmp/piw-logger'
 # inproc queue
 INT_STATUS_QUEUE = 'inproc://status'
 ORACLE_QUEUE = 'inproc://oracle'
+ORACLE_NOTIFY_QUEUE = 'inproc://oracle-notify'
+DB_NOTIFY_QUEUE = 'inproc://db-notify'
 SCRIBE_QUEUE = 'inproc://scribe'
@@ -147,6 +147,12 @@ write access to the output directory.
             '--db-queue', metavar='ADDR', default=const.DB_QUEUE,
             help="The address of the queue used to talk to the database "
             "server (default: %(default)s)")
+        parser.add_argument(
+            '--db-workers', metavar='NUM', type=workers,
+            default=const.DB_WORKERS,
+            help="The number of database worker tasks to run; requests are "
+            "passed to whichever worker is idle so more workers permit more "
+            "long-running queries to run concurrently (default: %(default)s)")
         parser.add_argument(
             '--fs-queue', metavar='ADDR', default=const.FS_QUEUE,
             help="The address of the queue used to talk to the file-system "
@@ -202,19 +208,19 @@ write access to the output directory.
         self.tasks = [
             task(config)
             for task in (
-                Seraph,
-                TheOracle,
-                TheOracle,
-                TheOracle,
-                Lumberjack,
-                TheScribe,
-                TheSecretary,
-                BigBrother,
-                FileJuggler,
-                MrChase,
-                SlaveDriver,
-                TheArchitect,
-                CloudGazer,
+                [Seraph] +
+                [TheOracle] * config.db_workers +
+                [
+                    Lumberjack,
+                    TheScribe,
+                    TheSecretary,
+                    BigBrother,
+                    FileJuggler,
+                    MrChase,
+                    SlaveDriver,
+                    TheArchitect,
+                    CloudGazer,
+                ]
             )
         ]
         self.logger.info('starting tasks')
@@ -353,6 +359,17 @@ def sig_term(signo, stack_frame):
     raise SystemExit(0)
 
 
+def workers(s):
+    """
+    Convert *s*, a string representing a number of worker tasks, into an
+    :class:`int` which must be at least 1.
+    """
+    result = int(s)
+    if result < 1:
+        raise ValueError('at least 1 worker is required')
+    return result
+
+
 def fix_ipc_mode(address):
     if address.startswith('ipc://'):
         path = address[len('ipc://'):]
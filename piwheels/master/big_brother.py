@@ -109,7 +109,7 @@ class BigBrother(tasks.PauseableTask):
     def loop(self):
         # Leave 15 seconds between each run of the stats
         if datetime.now(tz=UTC) - self.last_stats_run > timedelta(seconds=30):
-            rec = self.db.get_statistics()
+            rec = self.db.get_statistics()._asdict()
             # Rename a couple of columns
             rec['builds_last_hour'] = rec.pop('builds_count_last_hour')
             rec['builds_success'] = rec.pop('builds_count_success')
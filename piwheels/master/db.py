@@ -65,6 +65,10 @@ ProjectFilesRow = namedtuple('ProjectFilesRow', (
     'version', 'abi_tag', 'filename', 'filesize', 'filehash'))
 RewritePendingRow = namedtuple('RewritePendingRow', (
     'package', 'added_at', 'command'))
+StatisticsRow = namedtuple('StatisticsRow', (
+    'packages_built', 'builds_count', 'builds_count_success',
+    'builds_count_last_hour', 'builds_time', 'files_count', 'builds_size',
+    'downloads_last_month', 'downloads_all'))
 
 
 def sanitize(s):
@@ -197,21 +201,34 @@ class Database:
         Log a download in the database, including data derived from JSON in
         pip's user-agent.
         """
+        self.log_downloads([download])
+
+    def log_downloads(self, downloads):
+        """
+        Log several *downloads* in the database within a single transaction
+        (see :meth:`log_download`).
+        """
+        if not downloads:
+            return
         with self._conn.begin():
             self._conn.execute(
                 "VALUES (log_download(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s))",
-                (
-                    download.filename,
-                    download.host,
-                    download.timestamp.astimezone(UTC).replace(tzinfo=None),
-                    download.arch,
-                    download.distro_name,
-                    download.distro_version,
-                    download.os_name,
-                    download.os_version,
-                    download.py_name,
-                    download.py_version,
-                ))
+                [
+                    (
+                        download.filename,
+                        download.host,
+                        download.timestamp.astimezone(UTC).replace(
+                            tzinfo=None),
+                        download.arch,
+                        download.distro_name,
+                        download.distro_version,
+                        download.os_name,
+                        download.os_version,
+                        download.py_name,
+                        download.py_version,
+                    )
+                    for download in downloads
+                ])
 
     def log_build(self, build):
         """
@@ -296,7 +313,8 @@ class Database:
         with self._conn.begin():
             return {
                 rec.package
-                for rec in self._conn.execute(self._packages.select())
+                for rec in self._conn.execution_options(stream_results=True).
+                execute(select([self._packages.c.package]))
             }
 
     def get_all_package_versions(self):
@@ -306,7 +324,9 @@ class Database:
         with self._conn.begin():
             return {
                 (rec.package, rec.version)
-                for rec in self._conn.execute(self._versions.select())
+                for rec in self._conn.execution_options(stream_results=True).
+                execute(select([
+                    self._versions.c.package, self._versions.c.version]))
             }
 
     def get_build_queue(self, limit=1000):
@@ -332,14 +352,14 @@ class Database:
 
     def get_statistics(self):
         """
-        Return various build related statistics from the database.
+        Return various build related statistics from the database (see
+        :class:`StatisticsRow` for the fields returned).
         """
         with self._conn.begin():
-            return dict(
-                self._conn.execute(
-                    "SELECT * FROM get_statistics()"
-                ).first().items()
-            )
+            return StatisticsRow(*self._conn.execute(
+                "SELECT %s FROM get_statistics()" %
+                ", ".join(StatisticsRow._fields)
+            ).first())
 
     def get_search_index(self):
         """
@@ -33,19 +33,30 @@ Defines the :class:`Lumberjack` task; see class for more details.
     :members:
 """
 
+from datetime import datetime, timedelta, timezone
+
 from .. import protocols, transport, tasks
 from ..states import DownloadState
 from .the_oracle import DbClient
 
 
+UTC = timezone.utc
+
+
 class Lumberjack(tasks.PauseableTask):
     """
     This task handles incoming log entries from the httpd server, and updates
     the database with them. The external :program:`piw-logger` script handles
     parsing the raw log entries into the format expected by this task, so this
     is an extremely basic class.
+
+    Downloads are not written to the database individually; they are
+    buffered and written in batches of up to :attr:`batch_size` entries, or
+    whatever has arrived after :attr:`batch_delay`, whichever comes first.
     """
     name = 'master.lumberjack'
+    batch_size = 128
+    batch_delay = timedelta(milliseconds=200)
 
     def __init__(self, config):
         super().__init__(config)
@@ -54,11 +65,44 @@ class Lumberjack(tasks.PauseableTask):
         log_queue.bind(config.log_queue)
         self.register(log_queue, self.handle_log)
         self.db = DbClient(config, self.logger)
+        self.downloads = []
+        self.last_flush = datetime.now(tz=UTC)
 
     def close(self):
+        try:
+            self.flush()
+        except (IOError, transport.Error) as e:
+            self.logger.error('failed to log %d downloads: %s',
+                              len(self.downloads), e)
         self.db.close()
         super().close()
 
+    def loop(self):
+        if (
+                len(self.downloads) >= self.batch_size or
+                datetime.now(tz=UTC) - self.last_flush >= self.batch_delay):
+            self.flush()
+
+    def poll(self):
+        # While downloads are buffered, don't wait longer than the remainder
+        # of batch_delay; otherwise loop wouldn't get a chance to flush them
+        # until the default (much longer) poll timeout expired
+        if self.downloads:
+            remaining = (
+                self.last_flush + self.batch_delay - datetime.now(tz=UTC))
+            super().poll(max(0, remaining.total_seconds()))
+        else:
+            super().poll()
+
+    def flush(self):
+        """
+        Write all buffered downloads to the database.
+        """
+        if self.downloads:
+            self.db.log_downloads(self.downloads)
+            self.downloads = []
+        self.last_flush = datetime.now(tz=UTC)
+
     def handle_log(self, queue):
         """
         Handle requests from :program:`piw-logger` instances.
@@ -75,4 +119,4 @@ class Lumberjack(tasks.PauseableTask):
             download = DownloadState.from_message(data)
             self.logger.info('logging download of %s from %s',
                              download.filename, download.host)
-            self.db.log_download(download)
+            self.downloads.append(download)
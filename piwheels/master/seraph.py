@@ -39,7 +39,14 @@ from .. import const, tasks, transport
 class Seraph(tasks.Task):
     """
     This task is a simple load-sharing router for
-    :class:`~.the_oracle.TheOracle` tasks.
+    :class:`~.the_oracle.TheOracle` tasks. Each instance of
+    :class:`~.the_oracle.TheOracle` announces it is ready for work by sending
+    "READY", and thereafter by sending its reply to the last request. Requests
+    are only ever passed to an idle instance, the least recently used first.
+
+    This task also re-publishes the cache invalidation messages of each
+    :class:`~.the_oracle.TheOracle` instance to all instances (including the
+    sender).
     """
     name = 'master.seraph'
 
@@ -49,29 +56,48 @@ class Seraph(tasks.Task):
         self.front_queue.bind(config.db_queue)
         self.back_queue = self.socket(transport.ROUTER)
         self.back_queue.bind(const.ORACLE_QUEUE)
+        self.notify_in_queue = self.socket(transport.SUB)
+        self.notify_in_queue.bind(const.ORACLE_NOTIFY_QUEUE)
+        self.notify_in_queue.subscribe('')
+        self.notify_out_queue = self.socket(transport.PUB)
+        self.notify_out_queue.bind(const.DB_NOTIFY_QUEUE)
         self.workers = []
-        self.register(self.front_queue, self.handle_front)
+        self.register(self.notify_in_queue, self.handle_notify)
+        # The front queue is only polled while workers are available (see
+        # handle_front and handle_back)
         self.register(self.back_queue, self.handle_back)
 
     def handle_front(self, queue):
         """
-        If any workers are currently available, receive
-        :class:`~.the_oracle.DbClient` requests from the front queue and send
-        it on to the worker including the client's address frame.
+        Receive a :class:`~.the_oracle.DbClient` request from the front queue
+        and send it on to the least recently used worker, including the
+        client's address frame. If this leaves no workers available, stop
+        polling the front queue until one becomes available again.
         """
-        if self.workers:
-            client, _, request = queue.recv_multipart()
-            worker = self.workers.pop(0)
-            self.back_queue.send_multipart([worker, _, client, _, request])
+        client, _, request = queue.recv_multipart()
+        worker = self.workers.pop(0)
+        if not self.workers:
+            self.unregister(self.front_queue)
+        self.back_queue.send_multipart([worker, _, client, _, request])
 
     def handle_back(self, queue):
         """
         Receive a response from an instance of :class:`~.the_oracle.TheOracle`
         on the back queue. Strip off the worker's address frame and add it back
-        to the available queue then send the response back to the client that
-        made the original request.
+        to the available queue (resuming polling of the front queue if it was
+        previously empty) then send the response back to the client that made
+        the original request.
         """
         worker, _, *msg = queue.recv_multipart()
+        if not self.workers:
+            self.register(self.front_queue, self.handle_front)
         self.workers.append(worker)
         if msg != [b'READY']:
             self.front_queue.send_multipart(msg)
+
+    def handle_notify(self, queue):
+        """
+        Receive a cache invalidation message from an instance of
+        :class:`~.the_oracle.TheOracle` and publish it to all subscribers.
+        """
+        self.notify_out_queue.send(queue.recv())
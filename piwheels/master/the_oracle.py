@@ -37,11 +37,17 @@ to it.
     :members:
 """
 
-import pickle
+from time import monotonic
 
 from .. import const, protocols, transport, tasks
 from ..states import BuildState, DownloadState
-from .db import Database, ProjectVersionsRow, ProjectFilesRow, RewritePendingRow
+from .db import (
+    Database,
+    ProjectVersionsRow,
+    ProjectFilesRow,
+    RewritePendingRow,
+    StatisticsRow,
+)
 
 
 class TheOracle(tasks.Task):
@@ -57,20 +63,66 @@ class TheOracle(tasks.Task):
     :class:`TheOracle`. Rather, multiple instances of :class:`TheOracle` are
     spawned and :class:`~.seraph.Seraph` sits in front of these acting as a
     simple load-sharing router for the RPC clients.
+
+    Several results are cached by each instance of this class. When a request
+    changes the data behind a cached result, an "INVALIDATE" message naming
+    the affected request is published (via :class:`~.seraph.Seraph`) to all
+    instances of this class.
     """
     name = 'master.the_oracle'
     instance = 0
+    cache_ttl = 60
+    # Messages whose (serialized) replies are cached; see _cached_reply
+    cached = frozenset({'ALLPKGS', 'ALLVERS', 'GETABIS', 'GETPYPI'})
+    # Maps each request message to a function taking the task and the
+    # message's data; built once here rather than on every request
+    dispatch = {
+        'ALLPKGS':      lambda self, data: self.do_allpkgs(),
+        'ALLVERS':      lambda self, data: self.do_allvers(),
+        'NEWPKG':       lambda self, data: self.do_newpkg(*data),
+        'NEWVER':       lambda self, data: self.do_newver(*data),
+        'SKIPPKG':      lambda self, data: self.do_skippkg(*data),
+        'SKIPVER':      lambda self, data: self.do_skipver(*data),
+        'LOGDOWNLOAD':  lambda self, data: self.do_logdownload(data),
+        'LOGDOWNLOADS': lambda self, data: self.do_logdownloads(data),
+        'LOGBUILD':     lambda self, data: self.do_logbuild(data),
+        'DELBUILD':     lambda self, data: self.do_delbuild(*data),
+        'PKGFILES':     lambda self, data: self.do_pkgfiles(data),
+        'PROJVERS':     lambda self, data: self.do_projvers(data),
+        'PROJFILES':    lambda self, data: self.do_projfiles(data),
+        'VERFILES':     lambda self, data: self.do_verfiles(*data),
+        'GETSKIP':      lambda self, data: self.do_getskip(*data),
+        'PKGEXISTS':    lambda self, data: self.do_pkgexists(data),
+        'VEREXISTS':    lambda self, data: self.do_verexists(*data),
+        'GETABIS':      lambda self, data: self.do_getabis(),
+        'GETPYPI':      lambda self, data: self.do_getpypi(),
+        'SETPYPI':      lambda self, data: self.do_setpypi(data),
+        'GETSTATS':     lambda self, data: self.do_getstats(),
+        'GETSEARCH':    lambda self, data: self.do_getsearch(),
+        'FILEDEPS':     lambda self, data: self.do_filedeps(data),
+        'SAVERWP':      lambda self, data: self.do_saverwp(data),
+        'LOADRWP':      lambda self, data: self.do_loadrwp(),
+    }
 
     def __init__(self, config):
         TheOracle.instance += 1
         self.name = '%s_%d' % (TheOracle.name, TheOracle.instance)
         super().__init__(config)
         self.db = Database(config.dsn)
+        self._cache = {}
         db_queue = self.socket(
             transport.REQ, protocol=protocols.the_oracle)
         db_queue.hwm = 10
         db_queue.connect(const.ORACLE_QUEUE)
+        self.notify_queue = self.socket(
+            transport.PUB, protocol=protocols.db_notify)
+        self.notify_queue.connect(const.ORACLE_NOTIFY_QUEUE)
+        self.invalid_queue = self.socket(
+            transport.SUB, protocol=reversed(protocols.db_notify))
+        self.invalid_queue.connect(const.DB_NOTIFY_QUEUE)
+        self.invalid_queue.subscribe('')
         self.register(db_queue, self.handle_db_request)
+        self.register(self.invalid_queue, self.handle_invalidate)
         db_queue.send(b'READY')
 
     def close(self):
@@ -92,40 +144,61 @@ class TheOracle(tasks.Task):
             # won't go anywhere (bogus address) but that doesn't matter as we
             # just want to get the socket back to receiving state
             addr, msg, data = b'', '', str(exc)
+        # Apply any pending invalidations before consulting the cache; the
+        # poller may have returned this request ahead of an invalidation that
+        # the client has already seen
+        while self.invalid_queue.poll(0):
+            self.handle_invalidate(self.invalid_queue)
+        try:
+            buf = self._cached_reply(msg)
+        except KeyError:
+            try:
+                result = self.dispatch[msg](self, data)
+            except Exception as exc:
+                self.logger.error('Error handling db request: %s', msg)
+                buf = queue.dump_msg('ERROR', str(exc))
+            else:
+                buf = queue.dump_msg('OK', result)
+                if msg in self.cached:
+                    self._cache[msg] = (monotonic() + self.cache_ttl, buf)
+        queue.send_addr_buf(addr, buf)  # see note above
+
+    def handle_invalidate(self, queue):
+        """
+        Handle cache invalidation messages published by any instance of
+        :class:`TheOracle` (including this one).
+        """
         try:
-            handler = {
-                'ALLPKGS':     lambda: self.do_allpkgs(),
-                'ALLVERS':     lambda: self.do_allvers(),
-                'NEWPKG':      lambda: self.do_newpkg(*data),
-                'NEWVER':      lambda: self.do_newver(*data),
-                'SKIPPKG':     lambda: self.do_skippkg(*data),
-                'SKIPVER':     lambda: self.do_skipver(*data),
-                'LOGDOWNLOAD': lambda: self.do_logdownload(data),
-                'LOGBUILD':    lambda: self.do_logbuild(data),
-                'DELBUILD':    lambda: self.do_delbuild(*data),
-                'PKGFILES':    lambda: self.do_pkgfiles(data),
-                'PROJVERS':    lambda: self.do_projvers(data),
-                'PROJFILES':   lambda: self.do_projfiles(data),
-                'VERFILES':    lambda: self.do_verfiles(*data),
-                'GETSKIP':     lambda: self.do_getskip(*data),
-                'PKGEXISTS':   lambda: self.do_pkgexists(data),
-                'VEREXISTS':   lambda: self.do_verexists(*data),
-                'GETABIS':     lambda: self.do_getabis(),
-                'GETPYPI':     lambda: self.do_getpypi(),
-                'SETPYPI':     lambda: self.do_setpypi(data),
-                'GETSTATS':    lambda: self.do_getstats(),
-                'GETSEARCH':   lambda: self.do_getsearch(),
-                'FILEDEPS':    lambda: self.do_filedeps(data),
-                'SAVERWP':     lambda: self.do_saverwp(data),
-                'LOADRWP':     lambda: self.do_loadrwp(),
-            }[msg]
-            result = handler()
-        except Exception as exc:
-            self.logger.error('Error handling db request: %s', msg)
-            msg, data = 'ERROR', str(exc)
+            msg, key = queue.recv_msg()
+        except IOError as exc:
+            self.logger.error(str(exc))
         else:
-            msg, data = 'OK', result
-        queue.send_addr_msg(addr, msg, data)  # see note above
+            self._cache.pop(key, None)
+
+    def _invalidate(self, key):
+        """
+        Remove *key* from the cache of this instance, and publish its
+        invalidation to all other instances.
+        """
+        self._cache.pop(key, None)
+        self.notify_queue.send_msg('INVALIDATE', key)
+
+    def _cached_reply(self, msg):
+        """
+        Return the serialized reply cached for *msg*, raising :exc:`KeyError`
+        if there is none or it is older than :attr:`cache_ttl` seconds. Only
+        the messages in :attr:`cached` have their replies cached, and the
+        handlers of messages which mutate the underlying data are expected to
+        :meth:`_invalidate` the relevant entries.
+
+        The expiry is a safety net; invalidations are normally published
+        promptly by :meth:`_invalidate`.
+        """
+        expiry, buf = self._cache[msg]
+        if monotonic() >= expiry:
+            del self._cache[msg]
+            raise KeyError(msg)
+        return buf
 
     def do_allpkgs(self):
         """
@@ -137,23 +210,35 @@ class TheOracle(tasks.Task):
     def do_allvers(self):
         """
         Handler for "ALLVERS" message, sent by :class:`DbClient` to request the
-        set of all (package, version) tuples known to the database.
+        set of all (package, version) tuples known to the database. This is
+        returned as a mapping of package names to lists of versions, so that
+        each package name is only transmitted once.
         """
-        return self.db.get_all_package_versions()
+        result = {}
+        for package, version in self.db.get_all_package_versions():
+            result.setdefault(package, []).append(version)
+        return result
 
     def do_newpkg(self, package, skip):
         """
         Handler for "NEWPKG" message, sent by :class:`DbClient` to register a
         new package.
         """
-        return self.db.add_new_package(package, skip)
+        result = self.db.add_new_package(package, skip)
+        if result:
+            self._invalidate('ALLPKGS')
+        return result
 
     def do_newver(self, package, version, released, skip):
         """
         Handler for "NEWVER" message, sent by :class:`DbClient` to register a
         new (package, version) tuple.
         """
-        return self.db.add_new_package_version(package, version, released, skip)
+        result = self.db.add_new_package_version(
+            package, version, released, skip)
+        if result:
+            self._invalidate('ALLVERS')
+        return result
 
     def do_skippkg(self, package, reason):
         """
@@ -176,6 +261,16 @@ class TheOracle(tasks.Task):
         """
         self.db.log_download(DownloadState.from_message(download))
 
+    def do_logdownloads(self, downloads):
+        """
+        Handler for "LOGDOWNLOADS" message, sent by :class:`DbClient` to
+        register several new downloads at once.
+        """
+        self.db.log_downloads([
+            DownloadState.from_message(download)
+            for download in downloads
+        ])
+
     def do_logbuild(self, build):
         """
         Handler for "LOGBUILD" message, sent by :class:`DbClient` to register a
@@ -261,12 +356,13 @@ class TheOracle(tasks.Task):
         last seen serial number from the PyPI changelog.
         """
         self.db.set_pypi_serial(serial)
+        self._invalidate('GETPYPI')
 
     def do_getstats(self):
         """
         Handler for "GETSTATS" message, sent by :class:`DbClient` to request
-        the latest database statistics, returned as a list of (field, value)
-        tuples.
+        the latest database statistics, returned as a
+        :class:`~.db.StatisticsRow` tuple.
         """
         return self.db.get_statistics()
 
@@ -368,6 +464,15 @@ class DbClient:
         """
         self._execute('LOGDOWNLOAD', download.as_message())
 
+    def log_downloads(self, downloads):
+        """
+        See :meth:`.db.Database.log_downloads`.
+        """
+        self._execute('LOGDOWNLOADS', [
+            download.as_message()
+            for download in downloads
+        ])
+
     def log_build(self, build):
         """
         See :meth:`.db.Database.log_build`.
@@ -403,13 +508,17 @@ class DbClient:
         """
         See :meth:`.db.Database.get_all_package_versions`.
         """
-        return self._execute('ALLVERS')
+        return {
+            (package, version)
+            for package, versions in self._execute('ALLVERS').items()
+            for version in versions
+        }
 
     def get_statistics(self):
         """
         See :meth:`.db.Database.get_statistics`.
         """
-        return self._execute('GETSTATS')
+        return StatisticsRow._make(self._execute('GETSTATS'))
 
     def get_search_index(self):
         """
@@ -28,7 +28,8 @@
 
 import ipaddress as ip
 import datetime as dt
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from collections.abc import Mapping
 
 from voluptuous import Schema, ExactSequence, Extra, Any
 
@@ -50,33 +51,41 @@ class _NoData:
 NoData = _NoData()
 
 
-class Protocol(namedtuple('Protocol', ('recv', 'send'))):
+class Protocol(namedtuple('Protocol', ('recv', 'send', 'opcodes'))):
     # Protocols are generally specified from the point of view of the master;
     # i.e. the recv dictionary contains the messages (and schemas) the master
     # task expects to recv, and the send dictionary contains the messages it
     # expects to send. The special __reversed__ method is overridden to allow
-    # client tasks to specify their protocol as reversed(some_protocol)
+    # client tasks to specify their protocol as reversed(some_protocol).
+    #
+    # Messages are normally identified on the wire by their name. Protocols
+    # created with opcodes=True instead identify messages by their position in
+    # the recv or send sequence, hence these must be given as ordered
+    # sequences of (message, schema) pairs. This is only suitable for
+    # protocols used between tasks within the master (which always run the
+    # same version); anything used by remote slaves or tools must keep sending
+    # names, so that a version mismatch produces a sensible error. By
+    # convention, new messages are appended to such sequences so that
+    # existing messages keep their opcodes
     __slots__ = ()
 
-    def __new__(cls, recv=None, send=None):
-        if recv is None:
-            recv = {}
-        else:
-            recv = {
-                msg: NoData if prototypes is NoData else Schema(prototypes)
-                for msg, prototypes in recv.items()
-            }
-        if send is None:
-            send = {}
-        else:
-            send = {
-                msg: NoData if prototypes is NoData else Schema(prototypes)
-                for msg, prototypes in send.items()
-            }
-        return super().__new__(cls, recv, send)
+    def __new__(cls, recv=None, send=None, opcodes=False):
+        return super().__new__(
+            cls, cls._schemas(recv), cls._schemas(send), opcodes)
+
+    @staticmethod
+    def _schemas(messages):
+        if messages is None:
+            messages = ()
+        elif isinstance(messages, Mapping):
+            messages = messages.items()
+        return OrderedDict(
+            (msg, NoData if prototypes is NoData else Schema(prototypes))
+            for msg, prototypes in messages
+        )
 
     def __reversed__(self):
-        return Protocol(self.send, self.recv)
+        return Protocol(self.send, self.recv, self.opcodes)
 
 
 _statistics = {      # statistics
@@ -228,35 +237,41 @@ slave_driver = Protocol(recv={
 })
 
 
-the_oracle = Protocol(recv={
-    'ALLPKGS':     NoData,
-    'ALLVERS':     NoData,
-    'NEWPKG':      ExactSequence([str, str]),  # package, skip reason
-    'NEWVER':      ExactSequence([str, str, dt.datetime, str]),  # package, version, released, skip reason
-    'SKIPPKG':     ExactSequence([str, str]),  # package, skip reason
-    'SKIPVER':     ExactSequence([str, str, str]),  # package, version, skip reason
-    'LOGDOWNLOAD': _download_state,
-    'LOGBUILD':    _build_state,
-    'DELBUILD':    ExactSequence([str, str]),  # package, version
-    'PKGFILES':    str,                        # package
-    'PROJVERS':    str,                        # package
-    'PROJFILES':   str,                        # package
-    'VERFILES':    ExactSequence([str, str]),  # package, version
-    'GETSKIP':     ExactSequence([str, str]),  # package, version
-    'PKGEXISTS':   str,                        # package
-    'VEREXISTS':   ExactSequence([str, str]),  # package, version
-    'GETABIS':     NoData,
-    'GETPYPI':     NoData,
-    'SETPYPI':     int,                        # PyPI serial number
-    'GETSTATS':    NoData,
-    'GETSEARCH':   NoData,
-    'FILEDEPS':    str,                        # filename
-    'SAVERWP':     [ExactSequence([str, dt.datetime, str])],
-    'LOADRWP':     NoData,
-}, send={
-    'OK':          Extra,  # result XXX refine this? Would mean separate returns...
-    'ERROR':       str,    # message
-})
+the_oracle = Protocol(recv=[
+    ('ALLPKGS',     NoData),
+    ('ALLVERS',     NoData),
+    ('NEWPKG',      ExactSequence([str, str])),  # package, skip reason
+    ('NEWVER',      ExactSequence([str, str, dt.datetime, str])),  # package, version, released, skip reason
+    ('SKIPPKG',     ExactSequence([str, str])),  # package, skip reason
+    ('SKIPVER',     ExactSequence([str, str, str])),  # package, version, skip reason
+    ('LOGDOWNLOAD', _download_state),
+    ('LOGBUILD',    _build_state),
+    ('DELBUILD',    ExactSequence([str, str])),  # package, version
+    ('PKGFILES',    str),                        # package
+    ('PROJVERS',    str),                        # package
+    ('PROJFILES',   str),                        # package
+    ('VERFILES',    ExactSequence([str, str])),  # package, version
+    ('GETSKIP',     ExactSequence([str, str])),  # package, version
+    ('PKGEXISTS',   str),                        # package
+    ('VEREXISTS',   ExactSequence([str, str])),  # package, version
+    ('GETABIS',     NoData),
+    ('GETPYPI',     NoData),
+    ('SETPYPI',     int),                        # PyPI serial number
+    ('GETSTATS',    NoData),
+    ('GETSEARCH',   NoData),
+    ('FILEDEPS',    str),                        # filename
+    ('SAVERWP',     [ExactSequence([str, dt.datetime, str])]),
+    ('LOADRWP',     NoData),
+    ('LOGDOWNLOADS', [_download_state]),
+], send=[
+    ('OK',          Extra),  # result XXX refine this? Would mean separate returns...
+    ('ERROR',       str),    # message
+], opcodes=True)
+
+
+db_notify = Protocol(send=[
+    ('INVALIDATE',  str),  # message whose cached result is no longer valid
+], opcodes=True)
 
 
 monitor_stats = Protocol(send={
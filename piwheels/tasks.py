@@ -138,6 +138,18 @@ class Task(Thread):
         self.poller.register(queue, flags)
         self.handlers[queue] = handler
 
+    def unregister(self, queue):
+        """
+        Stop polling *queue* on each cycle of the task. The queue remains
+        associated with the task (and will be closed by :meth:`close`); it can
+        be polled again by calling :meth:`register`.
+
+        :param transport.Socket queue:
+            The queue to stop polling.
+        """
+        self.poller.unregister(queue)
+        self.handlers[queue] = None
+
     def _ctrl(self, msg, data=protocols.NoData):
         queue = self.ctx.socket(
             transport.PUSH, protocol=reversed(self.control_protocol),
@@ -57,6 +57,11 @@ UNSUBSCRIBE = zmq.UNSUBSCRIBE
 Error = zmq.ZMQError
 Again = zmq.error.Again
 
+# Messages at least this large are handed to 0MQ without copying (the buffer
+# is referenced until 0MQ is finished with it). Below this size, the overhead
+# of tracking the buffer outweighs the cost of the copy
+COPY_THRESHOLD = 65536
+
 
 def default_encoder(encoder, value):
     if isinstance(value, dt.timedelta):
@@ -111,6 +116,17 @@ class Socket:
         self._logger = logger
         self._socket = socket
         self._protocol = protocol
+        if protocol.opcodes:
+            # Messages are sent as small integer opcodes rather than their
+            # names; each is numbered by its position in the protocol's
+            # definition
+            self._send_ops = {msg: op for op, msg in enumerate(protocol.send)}
+            self._send_names = dict(enumerate(protocol.send))
+            self._recv_ops = dict(enumerate(protocol.recv))
+        else:
+            self._send_ops = {msg: msg for msg in protocol.send}
+            self._send_names = self._send_ops
+            self._recv_ops = {msg: msg for msg in protocol.recv}
         self._socket.ipv6 = True
 
     def __enter__(self):
@@ -119,15 +135,16 @@ class Socket:
     def __exit__(self, exc_type, exc_value, exc_tb):
         self.close()
 
-    def _dump_msg(self, msg, data=NoData):
+    def dump_msg(self, msg, data=NoData):
         try:
             schema = self._protocol.send[msg]
         except KeyError:
             raise IOError('unknown message: %s' % msg)
+        op = self._send_ops[msg]
         if data is NoData:
             if schema is not NoData:
                 raise IOError('data must be specified for %s' % msg)
-            return cbor2.dumps(msg, default=default_encoder)
+            return cbor2.dumps(op, default=default_encoder)
         else:
             if schema is NoData:
                 raise IOError('no data expected for %s' % msg)
@@ -136,20 +153,26 @@ class Socket:
             except Invalid as e:
                 raise IOError('invalid data for %s: %s' % (msg, e))
             try:
-                return cbor2.dumps((msg, data), default=default_encoder)
+                return cbor2.dumps((op, data), default=default_encoder)
             except cbor2.CBOREncodeError as e:
                 raise IOError('unable to serialize data')
 
+    def _msg_name(self, op):
+        if isinstance(op, (int, str)):
+            try:
+                return self._recv_ops[op]
+            except KeyError:
+                pass
+        raise IOError('unknown message: %r' % (op,))
+
     def _load_msg(self, buf):
         try:
             msg = cbor2.loads(buf, tag_hook=default_decoder)
         except cbor2.CBORDecodeError as e:
             raise IOError('unable to deserialize data')
-        if isinstance(msg, str):
-            try:
-                schema = self._protocol.recv[msg]
-            except KeyError:
-                raise IOError('unknown message: %s' % msg)
+        if isinstance(msg, (int, str)):
+            msg = self._msg_name(msg)
+            schema = self._protocol.recv[msg]
             if schema is NoData:
                 return msg, None
             raise IOError('missing data for: %s' % msg)
@@ -158,10 +181,8 @@ class Socket:
                 msg, data = msg
             except (TypeError, ValueError):
                 raise IOError('invalid message structure received')
-            try:
-                schema = self._protocol.recv[msg]
-            except KeyError:
-                raise IOError('unknown message: %s' % msg)
+            msg = self._msg_name(msg)
+            schema = self._protocol.recv[msg]
             if schema is NoData:
                 raise IOError('data not expected for: %s' % msg)
             try:
@@ -225,7 +246,8 @@ class Socket:
 
     def send_msg(self, msg, data=NoData, flags=0):
         self._logger.debug('>> %s %r', msg, data)
-        return self._socket.send(self._dump_msg(msg, data), flags)
+        buf = self.dump_msg(msg, data)
+        return self._socket.send(buf, flags, copy=len(buf) < COPY_THRESHOLD)
 
     def recv_msg(self, flags=0):
         msg, data = self._load_msg(self._socket.recv(flags))
@@ -235,8 +257,27 @@ class Socket:
     def send_addr_msg(self, addr, msg, data=NoData, flags=0):
         self._logger.debug('>> %s %s %r',
                            hexlify(addr).decode('ascii'), msg, data)
-        self._socket.send_multipart([addr, b'', self._dump_msg(msg, data)],
-                                    flags)
+        self._send_addr_buf(addr, self.dump_msg(msg, data), flags)
+
+    def send_addr_buf(self, addr, buf, flags=0):
+        # The *buf* must be the result of an earlier call to dump_msg; it is
+        # only decoded again for the sake of the debug log
+        if self._logger.isEnabledFor(logging.DEBUG):
+            msg = cbor2.loads(buf, tag_hook=default_decoder)
+            if isinstance(msg, (int, str)):
+                op, data = msg, NoData
+            else:
+                op, data = msg
+            self._logger.debug('>> %s %s %r', hexlify(addr).decode('ascii'),
+                               self._send_names[op], data)
+        self._send_addr_buf(addr, buf, flags)
+
+    def _send_addr_buf(self, addr, buf, flags):
+        # Equivalent to send_multipart, but only the (potentially large)
+        # message part is eligible to be sent without copying
+        self._socket.send(addr, flags | zmq.SNDMORE)
+        self._socket.send(b'', flags | zmq.SNDMORE)
+        self._socket.send(buf, flags, copy=len(buf) < COPY_THRESHOLD)
 
     def recv_addr_msg(self, flags=0):
         try:
@@ -43,17 +43,17 @@ UTC = timezone.utc
 
 @pytest.fixture()
 def stats_result(request):
-    return {
-        'packages_built':         0,
-        'builds_count':           0,
-        'builds_count_success':   0,
-        'builds_count_last_hour': 0,
-        'builds_time':            timedelta(0),
-        'files_count':            0,
-        'builds_size':            0,
-        'downloads_last_month':   10,
-        'downloads_all':          100,
-    }
+    return [
+        0,             # packages_built
+        0,             # builds_count
+        0,             # builds_count_success
+        0,             # builds_count_last_hour
+        timedelta(0),  # builds_time
+        0,             # files_count
+        0,             # builds_size
+        10,            # downloads_last_month
+        100,           # downloads_all
+    ]
 
 
 @pytest.fixture()
@@ -246,7 +246,7 @@ def test_get_statistics(db_intf, with_files):
         'downloads_last_month': 0,
         'downloads_all': 0,
     }
-    assert db_intf.get_statistics() == expected
+    assert db_intf.get_statistics()._asdict() == expected
 
 
 @pytest.mark.xfail(reason="downloads_recent view needs fixing")
@@ -27,6 +27,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 
+from time import monotonic
 from unittest import mock
 
 import pytest
@@ -54,13 +55,43 @@ def log_queue(request, zmq_context, master_config):
 
 def test_log_valid(db_queue, log_queue, download_state, task):
     log_queue.send_msg('LOG', list(download_state))
-    db_queue.expect('LOGDOWNLOAD', download_state)
-    db_queue.send('OK', None)
     task.poll()
     assert task.logger.info.call_args == mock.call(
         'logging download of %s from %s',
         download_state.filename, download_state.host)
+    assert task.downloads == [download_state]
+    db_queue.expect('LOGDOWNLOADS', [download_state])
+    db_queue.send('OK', None)
+    task.last_flush -= task.batch_delay
+    task.loop()
+    db_queue.check()
+    assert task.downloads == []
+
+
+def test_log_batch_size(db_queue, log_queue, download_state, task):
+    task.batch_size = 2
+    for i in range(2):
+        log_queue.send_msg('LOG', list(download_state))
+        task.poll()
+    db_queue.expect('LOGDOWNLOADS', [download_state] * 2)
+    db_queue.send('OK', None)
+    task.loop()
+    db_queue.check()
+    assert task.downloads == []
+
+
+def test_log_poll_timeout(db_queue, log_queue, download_state, task):
+    log_queue.send_msg('LOG', list(download_state))
+    task.poll()
+    assert task.downloads == [download_state]
+    start = monotonic()
+    task.poll()
+    assert monotonic() - start < 1
+    db_queue.expect('LOGDOWNLOADS', [download_state])
+    db_queue.send('OK', None)
+    task.loop()
     db_queue.check()
+    assert task.downloads == []
 
 
 def test_log_invalid(db_queue, log_queue, task):
@@ -32,6 +32,7 @@ from unittest import mock
 from threading import Thread
 
 import pytest
+import configargparse
 
 from conftest import find_message
 from piwheels import __version__, protocols, transport
@@ -114,6 +115,15 @@ def test_version(capsys):
     assert out.strip() == __version__
 
 
+def test_db_workers():
+    parser = main.configure_parser()
+    assert parser.parse_args(['--db-workers', '2']).db_workers == 2
+    with pytest.raises(configargparse.ArgumentError):
+        main(['--db-workers', '0'])
+    with pytest.raises(configargparse.ArgumentError):
+        main(['--db-workers', 'foo'])
+
+
 def test_no_root(caplog):
     with mock.patch('os.geteuid') as geteuid:
         geteuid.return_value = 0
@@ -74,3 +74,50 @@ def test_router_no_workers(zmq_context, master_config):
     finally:
         seraph.quit()
         seraph.join()
+
+
+def test_router_polls_front_only_with_workers(zmq_context, master_config):
+    seraph = Seraph(master_config)
+    try:
+        assert seraph.handlers[seraph.front_queue] is None
+        worker = zmq_context.socket(transport.REQ)
+        worker.connect(const.ORACLE_QUEUE)
+        worker.send(b'READY')
+        assert seraph.back_queue.poll(2)
+        seraph.handle_back(seraph.back_queue)
+        assert seraph.handlers[seraph.front_queue] == seraph.handle_front
+        client = zmq_context.socket(transport.REQ)
+        client.connect(master_config.db_queue)
+        client.send(cbor2.dumps(['FOO']))
+        assert seraph.front_queue.poll(2)
+        seraph.handle_front(seraph.front_queue)
+        assert seraph.handlers[seraph.front_queue] is None
+        client_addr, empty, msg = worker.recv_multipart()
+        assert cbor2.loads(msg) == ['FOO']
+        client.close()
+        worker.close()
+    finally:
+        seraph.close()
+
+
+def test_notify_forwarded(zmq_context, master_config):
+    seraph = Seraph(master_config)
+    seraph.start()
+    try:
+        sub = zmq_context.socket(transport.SUB)
+        sub.connect(const.DB_NOTIFY_QUEUE)
+        sub.subscribe('')
+        pub = zmq_context.socket(transport.PUB)
+        pub.connect(const.ORACLE_NOTIFY_QUEUE)
+        # Subscriptions propagate asynchronously; keep publishing until the
+        # first message makes it through
+        for i in range(20):
+            pub.send(cbor2.dumps([0, 'ALLPKGS']))
+            if sub.poll(0.1):
+                break
+        assert cbor2.loads(sub.recv()) == [0, 'ALLPKGS']
+        sub.close()
+        pub.close()
+    finally:
+        seraph.quit()
+        seraph.join()
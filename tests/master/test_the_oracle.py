@@ -29,18 +29,20 @@
 
 from datetime import datetime, timedelta, timezone
 from operator import itemgetter
+from time import sleep
 
 import cbor2
 import pytest
 
 from conftest import PIWHEELS_USER
-from piwheels import const, transport
+from piwheels import const, transport, protocols
 from piwheels.master.db import Database
 from piwheels.master.seraph import Seraph
 from piwheels.master.the_oracle import TheOracle, DbClient, RewritePendingRow
 
 
 UTC = timezone.utc
+ERROR = list(protocols.the_oracle.send).index('ERROR')
 
 
 @pytest.fixture(scope='function')
@@ -91,14 +93,14 @@ def test_oracle_bad_request(mock_seraph, task):
     assert mock_seraph.recv() == b'READY'
     mock_seraph.send_multipart([b'foo', b'', cbor2.dumps('FOO')])
     address, empty, resp = mock_seraph.recv_multipart()
-    assert cbor2.loads(resp) == ['ERROR', repr('')]
+    assert cbor2.loads(resp) == [ERROR, repr('')]
 
 
 def test_oracle_badly_formed_request(mock_seraph, task):
     assert mock_seraph.recv() == b'READY'
     mock_seraph.send_multipart([b'foo', b'', b'', b'', b''])
     address, empty, resp = mock_seraph.recv_multipart()
-    assert cbor2.loads(resp) == ['ERROR', repr('')]
+    assert cbor2.loads(resp) == [ERROR, repr('')]
 
 
 def test_database_error(db, with_schema, db_client):
@@ -116,6 +118,54 @@ def test_get_all_package_versions(db, with_package_version, db_client):
     assert db_client.get_all_package_versions() == {('foo', '0.1')}
 
 
+def test_get_all_packages_cached(db, with_package, db_client):
+    assert db_client.get_all_packages() == {'foo'}
+    with db.begin():
+        db.execute("INSERT INTO packages (package) VALUES ('bar')")
+    assert db_client.get_all_packages() == {'foo'}
+    db_client.add_new_package('baz', '')
+    assert db_client.get_all_packages() == {'foo', 'bar', 'baz'}
+
+
+def test_get_all_packages_invalidated(db, with_package, db_client,
+                                      master_config):
+    other_client = DbClient(master_config)
+    try:
+        assert db_client.get_all_packages() == {'foo'}
+        assert other_client.add_new_package('bar', '')
+        assert db_client.get_all_packages() == {'foo', 'bar'}
+    finally:
+        other_client.close()
+
+
+def test_get_all_packages_invalidated_across_oracles(db, with_package,
+                                                    real_seraph, master_config):
+    oracles = [TheOracle(master_config) for i in range(2)]
+    for oracle in oracles:
+        oracle.start()
+    clients = [DbClient(master_config) for i in range(2)]
+    try:
+        # Seraph passes requests to the least recently used oracle, so these
+        # populate the cache of each oracle in turn, and the second client's
+        # final request is served by the oracle that didn't add the package
+        assert clients[0].get_all_packages() == {'foo'}
+        assert clients[1].get_all_packages() == {'foo'}
+        assert clients[0].add_new_package('bar', '')
+        # The invalidation reaches the other oracle asynchronously via Seraph
+        for i in range(20):
+            if clients[1].get_all_packages() == {'foo', 'bar'}:
+                break
+            sleep(0.1)
+        assert clients[1].get_all_packages() == {'foo', 'bar'}
+    finally:
+        for client in clients:
+            client.close()
+        for oracle in oracles:
+            oracle.quit()
+            oracle.join(2)
+            oracle.close()
+
+
 def test_add_new_package(db, with_schema, db_client):
     with db.begin():
         assert db.execute("SELECT COUNT(*) FROM packages").scalar() == 0
@@ -191,6 +241,14 @@ def test_log_download(db, with_files, download_state, db_client):
             "SELECT filename FROM downloads").scalar() == download_state.filename
 
 
+def test_log_downloads(db, with_files, download_state, db_client):
+    with db.begin():
+        assert db.execute("SELECT COUNT(*) FROM downloads").scalar() == 0
+    db_client.log_downloads([download_state, download_state])
+    with db.begin():
+        assert db.execute("SELECT COUNT(*) FROM downloads").scalar() == 2
+
+
 def test_log_build(db, with_package_version, build_state_hacked, db_client):
     with db.begin():
         assert db.execute("SELECT COUNT(*) FROM builds").scalar() == 0
@@ -268,9 +326,7 @@ def test_get_statistics(db_client, db, with_files):
         'downloads_last_month': 0,
         'downloads_all': 0,
     }
-    assert db_client.get_statistics() == expected
-    # Run twice to cover caching of Statstics type
-    assert db_client.get_statistics() == expected
+    assert db_client.get_statistics()._asdict() == expected
 
 
 @pytest.mark.xfail(reason="downloads_recent view needs fixing")
@@ -32,7 +32,7 @@ from time import sleep
 
 import pytest
 
-from piwheels import protocols, tasks
+from piwheels import protocols, tasks, transport
 
 
 class CounterTask(tasks.PauseableTask):
@@ -136,3 +136,13 @@ def test_broken_task_quits(master_config, master_control_queue):
     assert not task.is_alive()
     # Ensure the broken task tells the master to quit
     assert master_control_queue.recv_msg() == ('QUIT', None)
+
+
+def test_task_unregister(master_config, master_control_queue):
+    task = tasks.Task(master_config)
+    queue = task.socket(transport.PULL)
+    handler = mock.Mock()
+    task.register(queue, handler)
+    task.unregister(queue)
+    assert task.handlers[queue] is None
+    task.close()
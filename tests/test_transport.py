@@ -204,3 +204,121 @@ def test_hwm_attr():
     sock = ctx.socket(PULL)
     sock.hwm = 10
     assert sock.hwm == 10
+
+
+def test_msg_sent_as_name():
+    protocol = Protocol(recv={'FOO': NoData, 'BAR': int})
+    ctx = Context()
+    pull = ctx.socket(PULL)
+    push = ctx.socket(PUSH, protocol=reversed(protocol))
+    pull.bind('inproc://foo')
+    push.connect('inproc://foo')
+    push.send_msg('FOO')
+    assert cbor2.loads(pull.recv()) == 'FOO'
+    push.send_msg('BAR', 2)
+    assert cbor2.loads(pull.recv()) == ['BAR', 2]
+    push.close()
+    pull.close()
+
+
+def test_recv_opcode_without_opcodes():
+    ctx = Context()
+    pull = ctx.socket(PULL, protocol=Protocol(recv={'FOO': NoData}))
+    push = ctx.socket(PUSH)
+    pull.bind('inproc://foo')
+    push.connect('inproc://foo')
+    push.send(cbor2.dumps(0))
+    with pytest.raises(IOError):
+        pull.recv_msg()
+    push.close()
+    pull.close()
+
+
+def test_msg_sent_as_opcode():
+    # Opcodes follow the order of definition, not the order of names
+    protocol = Protocol(recv=[('FOO', NoData), ('BAR', int)], opcodes=True)
+    ctx = Context()
+    pull = ctx.socket(PULL)
+    push = ctx.socket(PUSH, protocol=reversed(protocol))
+    pull.bind('inproc://foo')
+    push.connect('inproc://foo')
+    push.send_msg('FOO')
+    assert cbor2.loads(pull.recv()) == 0
+    push.send_msg('BAR', 2)
+    assert cbor2.loads(pull.recv()) == [1, 2]
+    push.close()
+    pull.close()
+
+
+def test_recv_bad_opcode():
+    ctx = Context()
+    pull = ctx.socket(PULL, protocol=Protocol(recv={'FOO': NoData},
+                                              opcodes=True))
+    push = ctx.socket(PUSH)
+    pull.bind('inproc://foo')
+    push.connect('inproc://foo')
+    push.send(cbor2.dumps(1))
+    with pytest.raises(IOError):
+        pull.recv_msg()
+    push.send(cbor2.dumps(-1))
+    with pytest.raises(IOError):
+        pull.recv_msg()
+    push.send(cbor2.dumps(['FOO', 1]))
+    with pytest.raises(IOError):
+        pull.recv_msg()
+    push.close()
+    pull.close()
+
+
+def test_send_addr_buf():
+    protocol = Protocol(recv=[('FOO', NoData), ('BAR', int)], opcodes=True)
+    ctx = Context()
+    pull = ctx.socket(PULL, protocol=protocol)
+    push = ctx.socket(PUSH, protocol=reversed(protocol))
+    pull.bind('inproc://foo')
+    push.connect('inproc://foo')
+    buf = push.dump_msg('BAR', 2)
+    push.send_addr_buf(b'foo', buf)
+    push.send_addr_buf(b'bar', buf)
+    assert pull.recv_addr_msg() == (b'foo', 'BAR', 2)
+    assert pull.recv_addr_msg() == (b'bar', 'BAR', 2)
+    push.close()
+    pull.close()
+
+
+def test_send_addr_buf_logged():
+    protocol = Protocol(recv=[('FOO', NoData), ('BAR', int)], opcodes=True)
+    logger = mock.Mock()
+    ctx = Context()
+    pull = ctx.socket(PULL, protocol=protocol)
+    push = ctx.socket(PUSH, protocol=reversed(protocol), logger=logger)
+    pull.bind('inproc://foo')
+    push.connect('inproc://foo')
+    push.send_addr_buf(b'foo', push.dump_msg('BAR', 2))
+    assert logger.debug.call_args == mock.call(
+        '>> %s %s %r', '666f6f', 'BAR', 2)
+    push.send_addr_buf(b'foo', push.dump_msg('FOO'))
+    assert logger.debug.call_args == mock.call(
+        '>> %s %s %r', '666f6f', 'FOO', NoData)
+    assert pull.recv_addr_msg() == (b'foo', 'BAR', 2)
+    assert pull.recv_addr_msg() == (b'foo', 'FOO', None)
+    push.close()
+    pull.close()
+
+
+def test_appended_msg_keeps_opcodes():
+    old_protocol = Protocol(recv=[('FOO', NoData), ('BAR', int)],
+                            opcodes=True)
+    new_protocol = Protocol(recv=[('FOO', NoData), ('BAR', int), ('BAZ', str)],
+                            opcodes=True)
+    ctx = Context()
+    pull = ctx.socket(PULL, protocol=new_protocol)
+    push = ctx.socket(PUSH, protocol=reversed(old_protocol))
+    pull.bind('inproc://foo')
+    push.connect('inproc://foo')
+    push.send_msg('FOO')
+    assert pull.recv_msg() == ('FOO', None)
+    push.send_msg('BAR', 2)
+    assert pull.recv_msg() == ('BAR', 2)
+    push.close()
+    pull.close()